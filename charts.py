@@ -0,0 +1,183 @@
+import plotly.graph_objects as go
+
+
+def create_temperature_bar(value, min_val, max_val, num_segments=12):
+    # Normalize the value
+    norm_value = (value - min_val) / (max_val - min_val) * 100
+    
+    # Calculate segment width
+    segment_width = 100 / num_segments
+    
+    fig = go.Figure()
+    
+    # Add background shapes to create capsule
+    # Center rectangle
+    fig.add_shape(
+        type="rect",
+        x0=0,
+        y0=-0.4,
+        x1=100,
+        y1=0.4,
+        fillcolor="rgba(50, 50, 50, 0.2)",
+        line=dict(color="rgba(50, 50, 50, 0.5)", width=2),
+        layer="below"
+    )
+    
+    # Left cap
+    fig.add_shape(
+        type="circle",
+        x0=-0.4,
+        y0=-0.4,
+        x1=0.4,
+        y1=0.4,
+        fillcolor="rgba(50, 50, 50, 0.2)",
+        line=dict(color="rgba(50, 50, 50, 0.5)", width=2),
+        layer="below"
+    )
+    
+    # Right cap
+    fig.add_shape(
+        type="circle",
+        x0=99.6,
+        y0=-0.4,
+        x1=100.4,
+        y1=0.4,
+        fillcolor="rgba(50, 50, 50, 0.2)",
+        line=dict(color="rgba(50, 50, 50, 0.5)", width=2),
+        layer="below"
+    )
+    
+    # Create segments
+    for i in range(num_segments):
+        segment_start = i * segment_width
+        
+        # Determine if segment should be filled
+        is_filled = norm_value >= segment_start
+        
+        if is_filled:
+            # Calculate color based on segment position
+            # Start with cool green, transition through yellow to hot red
+            progress = i / (num_segments - 1)
+            if progress < 0.5:  # First half - green to yellow
+                green = 255
+                red = int(255 * (progress * 2))
+                blue = 0
+            else:  # Second half - yellow to red
+                green = int(255 * (1 - (progress - 0.5) * 2))
+                red = 255
+                blue = 0
+                
+            color = f"rgb({red}, {green}, {blue})"
+            
+            # Add segment with rounded corners for first and last segments
+            if i == 0:  # First segment
+                fig.add_shape(
+                    type="circle",  # Left cap of first segment
+                    x0=segment_start,
+                    y0=-0.3,
+                    x1=segment_start + 0.6,
+                    y1=0.3,
+                    fillcolor=color,
+                    line=dict(color=color, width=0),
+                    layer="above"
+                )
+            
+            # Add main segment rectangle
+            fig.add_shape(
+                type="rect",
+                x0=segment_start + (0.3 if i == 0 else 0),
+                y0=-0.3,
+                x1=segment_start + segment_width * 0.95,
+                y1=0.3,
+                fillcolor=color,
+                line=dict(color=color, width=0),
+                layer="above"
+            )
+            
+            if i == num_segments - 1 and norm_value >= 100:  # Last segment if filled
+                fig.add_shape(
+                    type="circle",  # Right cap of last segment
+                    x0=segment_start + segment_width * 0.95 - 0.6,
+                    y0=-0.3,
+                    x1=segment_start + segment_width * 0.95,
+                    y1=0.3,
+                    fillcolor=color,
+                    line=dict(color=color, width=0),
+                    layer="above"
+                )
+    
+    # Add temperature value with color based on level
+    progress = norm_value / 100
+    if progress < 0.5:
+        text_color = "green"
+    elif progress < 0.75:
+        text_color = "orange"
+    else:
+        text_color = "red"
+    
+    # Update layout
+    fig.update_layout(
+        title={
+            'text': f"Temperature: {value:.1f}°C",
+            'y':0.85,
+            'x':0.5,
+            'xanchor': 'center',
+            'yanchor': 'top',
+            'font': dict(size=16, color=text_color)
+        },
+        height=100,
+        margin=dict(l=10, r=10, t=40, b=10),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(
+            showgrid=False,
+            zeroline=False,
+            showticklabels=False,
+            range=[-1, 101],
+            fixedrange=True
+        ),
+        yaxis=dict(
+            showgrid=False,
+            zeroline=False,
+            showticklabels=False,
+            range=[-0.5, 0.5],
+            fixedrange=True
+        ),
+        showlegend=False
+    )
+    
+    return fig
+
+
+def create_line_chart(df, y_col, title, height=300):
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=df['timestamp'],
+        y=df[y_col],
+        mode='lines',
+        name=y_col,
+        line=dict(width=2)
+    ))
+    
+    fig.update_layout(
+        title=title,
+        height=height,
+        margin=dict(l=10, r=10, t=50, b=10),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor='LightGray',
+            title="Time"
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor='LightGray',
+            title=y_col
+        )
+    )
+    
+    return fig
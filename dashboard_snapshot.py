@@ -0,0 +1,44 @@
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+SNAPSHOT_PATH = os.getenv('DASHBOARD_SNAPSHOT', 'dashboard_snapshot.csv')
+SNAPSHOT_INTERVAL = 30  # Seconds between snapshot writes
+MAX_SNAPSHOT_AGE = 60 * 60  # Ignore snapshots older than the chart window (seconds)
+
+
+def load_snapshot(path=SNAPSHOT_PATH, max_age=MAX_SNAPSHOT_AGE):
+    """Return the last saved chart window, or None if it is missing or stale."""
+    if not os.path.exists(path):
+        return None
+    try:
+        if time.time() - os.path.getmtime(path) > max_age:
+            return None
+        df = pd.read_csv(path)
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        return df
+    except Exception as e:
+        print(f"Error loading dashboard snapshot: {e}")
+        return None
+
+
+def save_snapshot(df, path=SNAPSHOT_PATH):
+    """Write the chart window atomically so a concurrent reader never sees a partial file.
+
+    Each call writes its own temporary file, so sessions saving at the same time
+    cannot interleave; the last os.replace wins.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile('w', dir=directory, prefix=f".{name}.", suffix='.tmp',
+                                         delete=False, newline='') as f:
+            tmp_path = f.name
+            df.to_csv(f, index=False)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error saving dashboard snapshot: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
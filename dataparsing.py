@@ -1,9 +1,21 @@
-import pandas as pd
+import argparse
+import hashlib
+import io
 import json
+import os
 import re
 
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
 
-df = pd.read_csv("haas_3_25.csv", header=None, names=["Index", "Timestamp", "RawData"])
+# Single expanded output shared by the dashboard and the dataviz notebooks:
+# a directory of per-source CSV parts plus the parsing checkpoint
+EXPANDED_DIR = os.path.join(ROOT, 'haas_expanded')
+CHECKPOINT = 'checkpoint.json'
+RAW_COLUMNS = ["Index", "Timestamp", "RawData"]
+BLOCK_SIZE = 64 * 1024 * 1024  # Bytes of new log data parsed at a time
+HEAD_BYTES = 1024  # Parsed prefix compared to notice a replaced or rotated source file
 
 
 def fix_and_parse_json(raw):
@@ -17,10 +29,10 @@ def fix_and_parse_json(raw):
         # Replace "" with " (double-double quote to single)
         raw = raw.replace('""', '"')
 
-        
+
         raw = re.sub(r'\\"([^"]+)\\"(?=\s*:)', r'"\1"', raw)
 
-       
+
         raw = re.sub(r'"{1,2}([^":]+)"{1,2}(?=\s*:)', r'"\1"', raw)
 
         # Try parsing
@@ -35,17 +47,186 @@ def fix_and_parse_json(raw):
         return {}
 
 
-parsed_data = df["RawData"].apply(fix_and_parse_json)
+def expand(df):
+    """Expand the RawData JSON of a raw Haas export frame into one column per field."""
+    parsed_data = df["RawData"].apply(fix_and_parse_json)
+    expanded_df = pd.json_normalize(parsed_data.tolist())
+    return pd.concat([df[["Index", "Timestamp"]].reset_index(drop=True), expanded_df], axis=1)
 
 
-expanded_df = pd.json_normalize(parsed_data)
+def checkpoint_path(output):
+    return os.path.join(output, CHECKPOINT)
 
 
-final_df = pd.concat([df[["Index", "Timestamp"]], expanded_df], axis=1)
-
-
-final_df.to_csv("3_25_expanded.csv", index=False)
-
-
-print("Successfully expanded data:")
-print(final_df.head())
+def load_checkpoint(output):
+    try:
+        with open(checkpoint_path(output)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'sources': {}}
+
+
+def save_checkpoint(output, checkpoint):
+    tmp_path = f"{checkpoint_path(output)}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, checkpoint_path(output))
+
+
+def _head(path, length):
+    with open(path, 'rb') as f:
+        return f.read(length).hex()
+
+
+def _replaced(path, state):
+    """True if the already-parsed prefix of path no longer matches the checkpoint."""
+    offset = state['offset']
+    if not offset:
+        return False
+    return os.path.getsize(path) < offset or _head(path, min(HEAD_BYTES, offset)) != state['head']
+
+
+def _new_blocks(path, offset, block_size=BLOCK_SIZE, final=False):
+    """Yield (bytes, end_offset) for complete lines appended after offset.
+
+    A trailing line without a newline is left for the next run, since the
+    export may still be writing it, unless final is set for a finished export.
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        pending = b''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            data = pending + block
+            cut = data.rfind(b'\n') + 1
+            if cut == 0:
+                pending = data
+                continue
+            offset += cut
+            pending = data[cut:]
+            yield data[:cut], offset
+        if final and pending:
+            yield pending, offset + len(pending)
+
+
+def _part_name(path, number):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(path.encode()).hexdigest()[:8]
+    return f"{stem}-{digest}.{number}.csv"
+
+
+def _append(output, path, state, frame):
+    """Append parsed rows to the source's current part file.
+
+    When new JSON fields appear a new part is started with the wider header,
+    so existing output is never rewritten.
+    """
+    parts = state['parts']
+    columns = parts[-1]['columns'] if parts else []
+    new_columns = [c for c in frame.columns if c not in columns]
+    if new_columns:
+        columns = columns + new_columns
+        parts.append({'file': _part_name(path, len(parts) + 1), 'columns': columns, 'bytes': 0})
+
+    part = parts[-1]
+    part_path = os.path.join(output, part['file'])
+    frame.reindex(columns=columns).to_csv(part_path, mode='w' if new_columns else 'a',
+                                          header=bool(new_columns), index=False)
+    part['bytes'] = os.path.getsize(part_path)
+
+
+def _drop_parts(output, state):
+    for part in state['parts']:
+        part_path = os.path.join(output, part['file'])
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+
+def _truncate_to_checkpoint(output, state):
+    """Discard rows written after the last checkpoint by an interrupted run."""
+    if state['parts']:
+        part = state['parts'][-1]
+        part_path = os.path.join(output, part['file'])
+        if os.path.exists(part_path) and os.path.getsize(part_path) > part['bytes']:
+            os.truncate(part_path, part['bytes'])
+
+
+def parse_incremental(sources, output=EXPANDED_DIR, full=False, final=False):
+    """Parse only the lines appended to each source since the last run.
+
+    Each source gets its own part files in the output directory, with a byte
+    offset checkpointed per source. A source that shrank or whose parsed prefix
+    changed is treated as replaced: only its parts are dropped and re-parsed,
+    as happens for every named source when full is set. With full or final a
+    last line without a trailing newline is parsed too. Returns the number of
+    new rows written.
+    """
+    os.makedirs(output, exist_ok=True)
+    checkpoint = load_checkpoint(output)
+    rows = 0
+
+    for path in [os.path.abspath(path) for path in sources]:
+        state = checkpoint['sources'].get(path)
+        if state and (full or _replaced(path, state)):
+            if not full:
+                print(f"{path} was replaced, re-parsing it")
+            _drop_parts(output, checkpoint['sources'].pop(path))
+            save_checkpoint(output, checkpoint)
+
+        state = checkpoint['sources'].setdefault(path, {'offset': 0, 'head': '', 'parts': []})
+        _truncate_to_checkpoint(output, state)
+        for data, offset in _new_blocks(path, state['offset'], final=full or final):
+            df = pd.read_csv(io.BytesIO(data), header=None, names=RAW_COLUMNS)
+            _append(output, path, state, expand(df))
+            rows += len(df)
+            state['offset'] = offset
+            state['head'] = _head(path, min(HEAD_BYTES, offset))
+            # Checkpoint after every block so an interrupted run resumes where it stopped
+            save_checkpoint(output, checkpoint)
+        print(f"{path}: parsed up to byte {state['offset']}")
+
+    return rows
+
+
+def expanded_files(output=EXPANDED_DIR, sources=None):
+    """Part files of the expanded output, in source and schema order.
+
+    sources limits the result to the parts of those raw exports; paths are
+    resolved like the ones given to parse_incremental.
+    """
+    parsed = load_checkpoint(output)['sources']
+    if sources is None:
+        sources = list(parsed)
+    else:
+        sources = [os.path.abspath(path) for path in sources]
+        missing = [path for path in sources if path not in parsed]
+        if missing:
+            raise ValueError(f"{missing} have not been parsed into {output}; run dataparsing.py on them first")
+    return [os.path.join(output, part['file']) for path in sources for part in parsed[path]['parts']]
+
+
+def load_expanded(output=EXPANDED_DIR, sources=None):
+    """Read the expanded Haas data written by parse_incremental as one frame.
+
+    Without sources every parsed export is concatenated and Index values repeat
+    across them, so pass the exports an analysis is about.
+    """
+    files = expanded_files(output, sources)
+    if not files:
+        return pd.DataFrame()
+    return pd.concat([pd.read_csv(path, low_memory=False) for path in files], ignore_index=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally expand Haas MQTT log exports")
+    parser.add_argument('sources', nargs='*', default=['haas_3_25.csv'], help="Raw Haas CSV exports")
+    parser.add_argument('--output', default=EXPANDED_DIR, help="Expanded output directory shared by the dashboard and notebooks")
+    parser.add_argument('--full', action='store_true', help="Ignore checkpoints and re-parse the named sources")
+    parser.add_argument('--include-partial', action='store_true',
+                        help="Also parse a last line without a trailing newline (the export is finished)")
+    args = parser.parse_args()
+
+    rows = parse_incremental(args.sources, args.output, args.full, args.include_partial)
+    print(f"Successfully expanded {rows} new rows into {args.output}")
@@ -0,0 +1,380 @@
+import argparse
+import html
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 100_000
+SAMPLE_SIZE = 10_000  # Reservoir size per column, bounds memory for quantiles and histograms
+TOP_K = 20  # Frequent values tracked per non-numeric column
+N_BINS = 20
+SEED = 42
+
+
+class Reservoir:
+    """Uniform fixed-size sample of a stream that can be merged with another reservoir."""
+
+    def __init__(self, size, rng):
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.values = np.empty(0)
+
+    def add(self, values):
+        chunk = Reservoir(self.size, self.rng)
+        chunk.seen = len(values)
+        chunk.values = values if len(values) <= self.size else self.rng.choice(values, self.size, replace=False)
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Combine two samples so every item of both streams is equally likely to be kept."""
+        total = self.seen + other.seen
+        if total <= self.size:
+            self.values = np.concatenate([self.values, other.values])
+        else:
+            # Items drawn from each side follow the hypergeometric split of the combined stream
+            take = self.rng.hypergeometric(self.seen, other.seen, self.size)
+            self.values = np.concatenate([
+                self.rng.choice(self.values, take, replace=False),
+                self.rng.choice(other.values, self.size - take, replace=False),
+            ])
+        self.seen = total
+
+
+class FrequentValues:
+    """Misra-Gries summary of the most frequent values, mergeable with bounded size."""
+
+    def __init__(self, k):
+        self.k = k
+        self.counts = {}
+
+    def add(self, counts):
+        for value, count in counts.items():
+            self.counts[value] = self.counts.get(value, 0) + count
+        self._trim()
+
+    def merge(self, other):
+        self.add(other.counts)
+
+    def _trim(self):
+        if len(self.counts) > self.k:
+            cutoff = sorted(self.counts.values(), reverse=True)[self.k]
+            self.counts = {v: c - cutoff for v, c in self.counts.items() if c > cutoff}
+
+    def top(self):
+        return sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+
+
+class ColumnProfile:
+    """Exact counts, mean, variance, min and max plus sample-based summaries of one column.
+
+    Values that parse as numbers feed the moments and the reservoir; any other
+    non-null values feed the frequent-value summary, so a column may be mixed.
+    """
+
+    def __init__(self, name, sample_size, rng):
+        self.name = name
+        self.count = 0  # Numeric values
+        self.text_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sample = Reservoir(sample_size, rng)
+        self.frequent = FrequentValues(TOP_K)
+
+    @property
+    def present(self):
+        return self.count + self.text_count
+
+    @property
+    def kind(self):
+        if self.count and self.text_count:
+            return 'mixed'
+        return 'numeric' if self.count else 'categorical'
+
+    def add(self, series):
+        """Add one chunk of the column and return it coerced to numbers (NaN elsewhere)."""
+        numbers = pd.to_numeric(series, errors='coerce')
+        is_number = numbers.notna()
+        text = series[series.notna() & ~is_number]
+        if len(text):
+            self.text_count += len(text)
+            self.frequent.add(text.astype(str).value_counts().to_dict())
+
+        values = numbers[is_number].to_numpy(dtype=np.float64)
+        if len(values):
+            other = ColumnProfile(self.name, self.sample.size, self.sample.rng)
+            other.count = len(values)
+            other.mean = float(values.mean())
+            other.m2 = float(((values - other.mean) ** 2).sum())
+            other.min = float(values.min())
+            other.max = float(values.max())
+            self._merge_moments(other)
+            self.sample.add(values)
+        return numbers.astype(np.float64)
+
+    def _merge_moments(self, other):
+        # Chan et al. parallel update of mean and sum of squared deviations
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def merge(self, other):
+        if other.count:
+            self._merge_moments(other)
+        self.sample.merge(other.sample)
+        self.text_count += other.text_count
+        self.frequent.merge(other.frequent)
+
+    def summary(self, rows, n_bins=N_BINS):
+        result = {'count': self.present, 'missing': rows - self.present}
+        if self.kind == 'mixed':
+            result.update({'numeric': self.count, 'text': self.text_count})
+        if self.count:
+            result.update({
+                'mean': self.mean,
+                'std': float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else 0.0,
+                'min': self.min,
+                'max': self.max,
+            })
+            quantiles = np.quantile(self.sample.values, [0.25, 0.5, 0.75])
+            result.update({'25%': quantiles[0], '50%': quantiles[1], '75%': quantiles[2]})
+            # Bins span the exact range; heights are scaled up from the sample
+            counts, edges = np.histogram(self.sample.values, bins=n_bins, range=(self.min, self.max))
+            result['histogram'] = (counts * self.count / len(self.sample.values), edges)
+        if self.text_count:
+            result['top'] = self.frequent.top()
+        return result
+
+
+def _empty_comoments(k):
+    return {key: np.zeros((k, k)) for key in ['n', 'mean', 'm2', 'c']}
+
+
+def _chunk_comoments(frame):
+    """Pairwise-complete moments of a numeric chunk.
+
+    Entry [i, j] covers the rows where both column i and column j are present:
+    n is the row count, mean and m2 the mean and squared deviations of column i
+    over those rows, and c the co-moment of columns i and j. Values are shifted
+    by their column mean first so the sums do not lose precision to cancellation.
+    """
+    X = frame.to_numpy(dtype=np.float64)
+    present = ~np.isnan(X)
+    shift = np.nanmean(X, axis=0)
+    shifted = np.where(present, X - shift, 0.0)
+    mask = present.astype(np.float64)
+
+    n = mask.T @ mask
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(n > 0, (shifted.T @ mask) / n, 0.0)
+    m2 = np.maximum((shifted ** 2).T @ mask - n * mean ** 2, 0.0)
+    c = shifted.T @ shifted - n * mean * mean.T
+    return {'n': n, 'mean': mean + shift[:, None], 'm2': m2, 'c': c}
+
+
+def _merge_comoments(a, b):
+    """Chan et al. pairwise update, applied elementwise to aligned co-moment matrices."""
+    n = a['n'] + b['n']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weight = np.where(n > 0, b['n'] / n, 0.0)
+        factor = np.where(n > 0, a['n'] * b['n'] / n, 0.0)
+    delta = b['mean'] - a['mean']
+    return {
+        'n': n,
+        'mean': a['mean'] + delta * weight,
+        'm2': a['m2'] + b['m2'] + delta ** 2 * factor,
+        # delta.T[i, j] is the shift in column j's mean over the same rows
+        'c': a['c'] + b['c'] + delta * delta.T * factor,
+    }
+
+
+class DatasetProfile:
+    """Single-pass, bounded-memory profile of a tabular dataset.
+
+    Profiles built over different chunks, files or processes combine with merge(),
+    even when their columns differ in order or membership: rows a column never
+    saw count as missing. Correlations are pairwise-complete Pearson
+    coefficients from merged co-moments, so memory grows only with the number of
+    numeric columns.
+    """
+
+    def __init__(self, sample_size=SAMPLE_SIZE, seed=SEED):
+        self.sample_size = sample_size
+        self.rng = np.random.default_rng(seed)
+        self.rows = 0
+        self.columns = {}
+        self.numeric = []
+        self.comoments = _empty_comoments(0)
+
+    def _column(self, name):
+        if name not in self.columns:
+            self.columns[name] = ColumnProfile(name, self.sample_size, self.rng)
+        return self.columns[name]
+
+    def _add_comoments(self, names, comoments):
+        """Merge co-moments over names into the running matrices, growing them as needed."""
+        new = [name for name in names if name not in self.numeric]
+        if new:
+            size = len(self.numeric) + len(new)
+            grown = _empty_comoments(size)
+            k = len(self.numeric)
+            for key, matrix in self.comoments.items():
+                grown[key][:k, :k] = matrix
+            self.numeric = self.numeric + new
+            self.comoments = grown
+
+        index = np.ix_(*[[self.numeric.index(name) for name in names]] * 2)
+        aligned = _empty_comoments(len(self.numeric))
+        for key, matrix in comoments.items():
+            aligned[key][index] = matrix
+        self.comoments = _merge_comoments(self.comoments, aligned)
+
+    def add(self, chunk):
+        self.rows += len(chunk)
+        numbers = {}
+        for c in chunk.columns:
+            values = self._column(c).add(chunk[c])
+            if values.notna().any():
+                numbers[c] = values
+        if numbers:
+            self._add_comoments(list(numbers), _chunk_comoments(pd.DataFrame(numbers)))
+
+    def merge(self, other):
+        self.rows += other.rows
+        for name, profile in other.columns.items():
+            if name in self.columns:
+                self.columns[name].merge(profile)
+            else:
+                profile.sample.rng = self.rng
+                self.columns[name] = profile
+        if other.numeric:
+            self._add_comoments(other.numeric, other.comoments)
+        return self
+
+    def correlations(self):
+        m2 = self.comoments['m2']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = self.comoments['c'] / np.sqrt(m2 * m2.T)
+        return pd.DataFrame(corr, index=self.numeric, columns=self.numeric)
+
+
+def profile_file(path, chunk_size=CHUNK_SIZE, sample_size=SAMPLE_SIZE, seed=SEED):
+    """Profile one CSV file chunk by chunk."""
+    profile = DatasetProfile(sample_size, seed)
+    for chunk in pd.read_csv(path, chunksize=chunk_size, low_memory=False):
+        profile.add(chunk)
+        print(f"{path}: profiled {profile.rows} rows")
+    return profile
+
+
+def profile_files(paths, chunk_size=CHUNK_SIZE, sample_size=SAMPLE_SIZE, seed=SEED, workers=1):
+    """Profile several CSV files, one process per file, and merge the results."""
+    args = [(path, chunk_size, sample_size, seed + i) for i, path in enumerate(paths)]
+    if workers > 1:
+        with Pool(workers) as pool:
+            profiles = pool.starmap(profile_file, args)
+    else:
+        profiles = [profile_file(*a) for a in args]
+    merged = DatasetProfile(sample_size, seed)
+    for profile in profiles:
+        merged.merge(profile)
+    return merged
+
+
+def _histogram_svg(counts, width=240, height=60):
+    peak = counts.max() if counts.max() > 0 else 1
+    bar = width / len(counts)
+    bars = ''.join(
+        f'<rect x="{i * bar:.1f}" y="{height - h:.1f}" width="{bar * 0.9:.1f}" height="{h:.1f}" fill="#4c78a8"/>'
+        for i, h in enumerate(counts / peak * height)
+    )
+    return f'<svg width="{width}" height="{height}">{bars}</svg>'
+
+
+def _correlation_color(value):
+    if np.isnan(value):
+        return '#eee'
+    # Blue for negative, red for positive
+    alpha = min(abs(value), 1.0)
+    return f'rgba(214, 39, 40, {alpha:.2f})' if value > 0 else f'rgba(31, 119, 180, {alpha:.2f})'
+
+
+def render_html(profile, title, n_bins=N_BINS):
+    """Render the profile as a self-contained HTML page."""
+    sections = []
+    for name, column in profile.columns.items():
+        summary = column.summary(profile.rows, n_bins)
+        rows = ''.join(
+            f'<tr><th>{key}</th><td>{value:.4g}</td></tr>' if isinstance(value, float)
+            else f'<tr><th>{key}</th><td>{value}</td></tr>'
+            for key, value in summary.items() if key not in ('histogram', 'top')
+        )
+        extra = ''
+        if 'histogram' in summary:
+            extra += _histogram_svg(summary['histogram'][0])
+        if summary.get('top'):
+            extra += '<table>' + ''.join(
+                f'<tr><td>{html.escape(str(value))}</td><td>~{count}</td></tr>' for value, count in summary['top'][:10]
+            ) + '</table>'
+        sections.append(
+            f'<div class="column"><h3>{html.escape(str(name))} <small>({column.kind})</small></h3>'
+            f'<table>{rows}</table>{extra}</div>'
+        )
+
+    corr = profile.correlations() if profile.numeric else pd.DataFrame()
+    header = ''.join(f'<th>{html.escape(str(c))}</th>' for c in corr.columns)
+    body = ''.join(
+        f'<tr><th>{html.escape(str(i))}</th>'
+        + ''.join(f'<td style="background:{_correlation_color(v)}">{v:.2f}</td>' for v in corr.loc[i])
+        + '</tr>'
+        for i in corr.index
+    )
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>
+    body {{ font-family: sans-serif; margin: 2rem; }}
+    .column {{ display: inline-block; vertical-align: top; width: 300px; margin: 0 1rem 1rem 0; }}
+    table {{ border-collapse: collapse; font-size: 0.85rem; }}
+    th, td {{ padding: 0.2rem 0.5rem; text-align: right; border-bottom: 1px solid #ddd; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(title)}</h1>
+<p>{profile.rows} rows, {len(profile.columns)} columns. Quantiles and histogram shapes are estimated from a
+{profile.sample_size}-row reservoir sample per column; frequent-value counts are lower bounds.</p>
+<h2>Columns</h2>
+{''.join(sections)}
+<h2>Correlations (Pearson)</h2>
+<table><tr><th></th>{header}</tr>{body}</table>
+</body>
+</html>
+"""
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming data profile report for large CSV files")
+    parser.add_argument('csv_files', nargs='+', help="CSV files to profile")
+    parser.add_argument('--output', default='PROFILE.html', help="HTML report path")
+    parser.add_argument('--title', default='Dataset Profile', help="Report title")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Rows read per chunk")
+    parser.add_argument('--sample-size', type=int, default=SAMPLE_SIZE, help="Reservoir size per column")
+    parser.add_argument('--bins', type=int, default=N_BINS, help="Histogram bins")
+    parser.add_argument('--workers', type=int, default=1, help="Files profiled in parallel")
+    parser.add_argument('--seed', type=int, default=SEED, help="Random seed for sampling")
+    args = parser.parse_args()
+
+    profile = profile_files(args.csv_files, args.chunk_size, args.sample_size, args.seed, args.workers)
+    with open(args.output, 'w') as f:
+        f.write(render_html(profile, args.title, args.bins))
+    print(f"Wrote report to {args.output}")
@@ -0,0 +1,100 @@
+import json
+from collections import deque
+
+import numpy as np
+
+N_BINS = 10
+WINDOW_SIZE = 500  # Live samples compared against the baseline
+MIN_SAMPLES = 200  # Below this the live histogram is too sparse to judge
+PSI_THRESHOLD = 0.2  # Conventional "significant shift" level
+KS_THRESHOLD = 0.2
+# Thresholds are raised by the statistic's sampling noise on in-distribution data:
+# PSI behaves like chi-squared(bins - 1) / n, the KS statistic like c / sqrt(n).
+PSI_NOISE_SIGMAS = 3
+KS_NOISE_COEFFICIENT = 1.63  # ~99% critical value
+EPSILON = 1e-6  # Keeps PSI finite for empty bins
+
+
+def build_baseline(X, features, n_bins=N_BINS):
+    """Snapshot per-feature bin edges and bin proportions from the training matrix.
+
+    Edges are training-set quantiles so every bin starts with roughly equal mass;
+    the outer edges are open so live values outside the training range still land
+    in a bin.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    baseline = {}
+    for i, feature in enumerate(features):
+        inner = np.unique(np.quantile(X[:, i], np.linspace(0, 1, n_bins + 1)[1:-1]))
+        counts = np.bincount(np.searchsorted(inner, X[:, i], side='right'), minlength=len(inner) + 1)
+        baseline[feature] = {
+            'edges': inner.tolist(),
+            'proportions': (counts / counts.sum()).tolist(),
+        }
+    return baseline
+
+
+def save_baseline(baseline, path):
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2)
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+class DriftMonitor:
+    """Sliding-window histograms of live readings compared against a training baseline.
+
+    update() costs O(1) per sample: one binary search over a fixed, small number
+    of edges per feature plus a counter increment/decrement. status() costs
+    O(bins) per feature regardless of window size.
+    """
+
+    def __init__(self, baseline, window_size=WINDOW_SIZE):
+        self.features = list(baseline)
+        self.edges = {f: np.asarray(baseline[f]['edges']) for f in self.features}
+        self.expected = {f: np.asarray(baseline[f]['proportions']) for f in self.features}
+        self.counts = {f: np.zeros(len(self.expected[f]), dtype=np.int64) for f in self.features}
+        self.window = deque(maxlen=window_size)
+
+    def update(self, reading):
+        """Add one reading (a mapping of feature name to value) to the window."""
+        bins = {}
+        for f in self.features:
+            value = reading.get(f)
+            if value is None or value != value:  # Missing or NaN
+                continue
+            bins[f] = int(np.searchsorted(self.edges[f], value, side='right'))
+            self.counts[f][bins[f]] += 1
+
+        if len(self.window) == self.window.maxlen:
+            for f, b in self.window[0].items():
+                self.counts[f][b] -= 1
+        self.window.append(bins)
+
+    def status(self):
+        """Return {feature: {'psi', 'ks', 'samples', 'drift'}} for the current window."""
+        result = {}
+        for f in self.features:
+            samples = int(self.counts[f].sum())
+            if samples == 0:
+                result[f] = {'psi': 0.0, 'ks': 0.0, 'samples': 0, 'drift': False}
+                continue
+            actual = self.counts[f] / samples
+            expected = self.expected[f]
+            a = np.clip(actual, EPSILON, None)
+            e = np.clip(expected, EPSILON, None)
+            psi = float(np.sum((a - e) * np.log(a / e)))
+            # KS statistic evaluated at the bin edges
+            ks = float(np.max(np.abs(np.cumsum(actual) - np.cumsum(expected))))
+            dof = len(expected) - 1
+            psi_limit = PSI_THRESHOLD + (dof + PSI_NOISE_SIGMAS * np.sqrt(2 * dof)) / samples
+            ks_limit = KS_THRESHOLD + KS_NOISE_COEFFICIENT / np.sqrt(samples)
+            drift = bool(samples >= MIN_SAMPLES and (psi > psi_limit or ks > ks_limit))
+            result[f] = {'psi': psi, 'ks': ks, 'samples': samples, 'drift': drift}
+        return result
+
+    def drifted_features(self):
+        return [f for f, s in self.status().items() if s['drift']]
@@ -0,0 +1,27 @@
+import paho.mqtt.client as mqtt
+import os
+import ssl
+
+# MQTT Configuration
+MQTT_BROKER = os.getenv('MQTT_BROKER', 'localhost')
+MQTT_PORT = int(os.getenv('MQTT_PORT', '8883'))
+MQTT_TOPIC = os.getenv('MQTT_TOPIC', 'machine/data')
+MQTT_USERNAME = os.getenv('MQTT_USERNAME', '')
+MQTT_PASSWORD = os.getenv('MQTT_PASSWORD', '')
+
+
+def connect_client():
+    """Create a TLS MQTT client, connect it to the broker and start its network loop."""
+    client = mqtt.Client(protocol=mqtt.MQTTv5)
+
+    # Enable TLS/SSL
+    client.tls_set(cert_reqs=ssl.CERT_REQUIRED, tls_version=ssl.PROTOCOL_TLS)
+
+    if MQTT_USERNAME and MQTT_PASSWORD:
+        client.username_pw_set(MQTT_USERNAME, MQTT_PASSWORD)
+
+    print("Connecting to MQTT broker...")
+    client.connect(MQTT_BROKER, MQTT_PORT, 60)
+    client.loop_start()
+    print("Connected successfully to HiveMQ Cloud!")
+    return client
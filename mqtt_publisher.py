@@ -1,20 +1,12 @@
-import paho.mqtt.client as mqtt
 import json
 import time
 import pandas as pd
 from flask import Flask
 import threading
-import os
-import ssl
+from mqtt_client import MQTT_TOPIC, connect_client
 
 VOLTAGE = 220
 
-# MQTT Configuration
-MQTT_BROKER = os.getenv('MQTT_BROKER', 'localhost')
-MQTT_PORT = int(os.getenv('MQTT_PORT', '8883'))
-MQTT_TOPIC = os.getenv('MQTT_TOPIC', 'machine/data')
-MQTT_USERNAME = os.getenv('MQTT_USERNAME', '')
-MQTT_PASSWORD = os.getenv('MQTT_PASSWORD', '')
 def load_dataset():
     """Load and prepare the dataset from CSV."""
     df = pd.read_csv('Predictive_Maintenance_v2.csv')
@@ -24,23 +16,11 @@ def load_dataset():
 def publisher():
     """Background task that reads the dataset and publishes each row via MQTT."""
     df = load_dataset()
-    client = mqtt.Client(protocol=mqtt.MQTTv5)
+    client = None
 
-    # Enable TLS/SSL
-    client.tls_set(cert_reqs=ssl.CERT_REQUIRED, tls_version=ssl.PROTOCOL_TLS)
-
-    
-    MQTT_USERNAME = os.getenv('MQTT_USERNAME', '')
-    MQTT_PASSWORD = os.getenv('MQTT_PASSWORD', '')
-    if MQTT_USERNAME and MQTT_PASSWORD:
-        client.username_pw_set(MQTT_USERNAME, MQTT_PASSWORD)
-    
     try:
-        print("Connecting to MQTT broker...")
-        client.connect(MQTT_BROKER, MQTT_PORT, 60)
-        client.loop_start()
-        print("Connected successfully to HiveMQ Cloud!")
-        
+        client = connect_client()
+
         total_rows = len(df)
         current_row = 0
         print("Starting to publish data from dataset...")
@@ -64,8 +44,9 @@ def publisher():
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        client.loop_stop()
-        client.disconnect()
+        if client is not None:
+            client.loop_stop()
+            client.disconnect()
 
 app = Flask(__name__)
 
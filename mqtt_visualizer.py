@@ -1,16 +1,21 @@
+import time
+STARTUP_TIME = time.perf_counter()
+
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import paho.mqtt.client as mqtt
+import importlib
 import json
 import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from streamlit_autorefresh import st_autorefresh
-import time
-import joblib
 import os
 import ssl
+from drift_monitor import DriftMonitor, load_baseline
+from dashboard_snapshot import SNAPSHOT_INTERVAL, load_snapshot, save_snapshot
+
+# Plotly, paho and joblib (which pulls in sklearn) are imported on first use
+# so the page can render before they finish loading.
 
 # Config - Using environment variables for deployment
 MQTT_BROKER = os.getenv('MQTT_BROKER', 'localhost')
@@ -30,8 +35,8 @@ TEMP_THRESHOLDS = {
 }
 
 # Load the trained model
-@st.cache_resource
 def load_model():
+    import joblib
     try:
         model = joblib.load('random_forest_model.joblib')
         print("Model loaded successfully!")
@@ -40,6 +45,23 @@ def load_model():
         print(f"Error loading model: {e}")
         return None
 
+# Start loading the model in the background, once per server process
+@st.cache_resource
+def preload_model():
+    executor = ThreadPoolExecutor(max_workers=2)
+    # Warm the Plotly import alongside the model so the first chart doesn't pay for it
+    executor.submit(importlib.import_module, 'charts')
+    return executor.submit(load_model)
+
+# Load the training-set distribution snapshot written by train_model.py
+@st.cache_resource
+def load_drift_baseline():
+    try:
+        return load_baseline('drift_baseline.json')
+    except Exception as e:
+        print(f"Error loading drift baseline: {e}")
+        return None
+
 # Page config
 st.set_page_config(
     page_title="Machine Monitoring Dashboard",
@@ -47,6 +69,8 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+model_future = preload_model()
+
 # Custom CSS
 st.markdown("""
     <style>
@@ -101,14 +125,14 @@ def on_message(client, userdata, msg):
     except Exception as e:
         print(f"Error processing message: {e}")
 
-client = mqtt.Client(protocol=mqtt.MQTTv5)
-# Enable TLS/SSL
-client.tls_set(cert_reqs=ssl.CERT_REQUIRED, tls_version=ssl.PROTOCOL_TLS)
-client.on_connect = on_connect
-client.on_message = on_message
-
 def start_mqtt_client():
     try:
+        import paho.mqtt.client as mqtt
+        client = mqtt.Client(protocol=mqtt.MQTTv5)
+        # Enable TLS/SSL
+        client.tls_set(cert_reqs=ssl.CERT_REQUIRED, tls_version=ssl.PROTOCOL_TLS)
+        client.on_connect = on_connect
+        client.on_message = on_message
         if MQTT_USERNAME and MQTT_PASSWORD:
             client.username_pw_set(MQTT_USERNAME, MQTT_PASSWORD)
         client.connect(MQTT_BROKER, MQTT_PORT, 60)
@@ -122,7 +146,18 @@ threading.Thread(target=start_mqtt_client, daemon=True).start()
 if 'data' not in st.session_state:
     st.session_state.data = pd.DataFrame(columns=['timestamp', 'temperature', 'vibration', 'pressure', 'motor_current', 'power', 'failure'])
     st.session_state.last_slide = datetime.now()
-    st.session_state.model = load_model()
+    st.session_state.last_snapshot = time.monotonic()
+    st.session_state.first_chart = False
+    baseline = load_drift_baseline()
+    st.session_state.drift_monitor = DriftMonitor(baseline) if baseline else None
+
+    # Seed the chart window from the last snapshot so charts appear before new data arrives
+    snapshot = load_snapshot()
+    if snapshot is not None and not snapshot.empty:
+        st.session_state.data = snapshot
+        if st.session_state.drift_monitor is not None:
+            for reading in snapshot.to_dict('records'):
+                st.session_state.drift_monitor.update(reading)
 
 # Layout
 st.title("Machine Monitoring Dashboard")
@@ -134,186 +169,6 @@ row2_col1, row2_col2 = st.columns(2)
 # Add failure prediction section
 failure_section = st.container()
 
-def create_temperature_bar(value, min_val, max_val, num_segments=12):
-    # Normalize the value
-    norm_value = (value - min_val) / (max_val - min_val) * 100
-    
-    # Calculate segment width
-    segment_width = 100 / num_segments
-    
-    fig = go.Figure()
-    
-    # Add background shapes to create capsule
-    # Center rectangle
-    fig.add_shape(
-        type="rect",
-        x0=0,
-        y0=-0.4,
-        x1=100,
-        y1=0.4,
-        fillcolor="rgba(50, 50, 50, 0.2)",
-        line=dict(color="rgba(50, 50, 50, 0.5)", width=2),
-        layer="below"
-    )
-    
-    # Left cap
-    fig.add_shape(
-        type="circle",
-        x0=-0.4,
-        y0=-0.4,
-        x1=0.4,
-        y1=0.4,
-        fillcolor="rgba(50, 50, 50, 0.2)",
-        line=dict(color="rgba(50, 50, 50, 0.5)", width=2),
-        layer="below"
-    )
-    
-    # Right cap
-    fig.add_shape(
-        type="circle",
-        x0=99.6,
-        y0=-0.4,
-        x1=100.4,
-        y1=0.4,
-        fillcolor="rgba(50, 50, 50, 0.2)",
-        line=dict(color="rgba(50, 50, 50, 0.5)", width=2),
-        layer="below"
-    )
-    
-    # Create segments
-    for i in range(num_segments):
-        segment_start = i * segment_width
-        
-        # Determine if segment should be filled
-        is_filled = norm_value >= segment_start
-        
-        if is_filled:
-            # Calculate color based on segment position
-            # Start with cool green, transition through yellow to hot red
-            progress = i / (num_segments - 1)
-            if progress < 0.5:  # First half - green to yellow
-                green = 255
-                red = int(255 * (progress * 2))
-                blue = 0
-            else:  # Second half - yellow to red
-                green = int(255 * (1 - (progress - 0.5) * 2))
-                red = 255
-                blue = 0
-                
-            color = f"rgb({red}, {green}, {blue})"
-            
-            # Add segment with rounded corners for first and last segments
-            if i == 0:  # First segment
-                fig.add_shape(
-                    type="circle",  # Left cap of first segment
-                    x0=segment_start,
-                    y0=-0.3,
-                    x1=segment_start + 0.6,
-                    y1=0.3,
-                    fillcolor=color,
-                    line=dict(color=color, width=0),
-                    layer="above"
-                )
-            
-            # Add main segment rectangle
-            fig.add_shape(
-                type="rect",
-                x0=segment_start + (0.3 if i == 0 else 0),
-                y0=-0.3,
-                x1=segment_start + segment_width * 0.95,
-                y1=0.3,
-                fillcolor=color,
-                line=dict(color=color, width=0),
-                layer="above"
-            )
-            
-            if i == num_segments - 1 and norm_value >= 100:  # Last segment if filled
-                fig.add_shape(
-                    type="circle",  # Right cap of last segment
-                    x0=segment_start + segment_width * 0.95 - 0.6,
-                    y0=-0.3,
-                    x1=segment_start + segment_width * 0.95,
-                    y1=0.3,
-                    fillcolor=color,
-                    line=dict(color=color, width=0),
-                    layer="above"
-                )
-    
-    # Add temperature value with color based on level
-    progress = norm_value / 100
-    if progress < 0.5:
-        text_color = "green"
-    elif progress < 0.75:
-        text_color = "orange"
-    else:
-        text_color = "red"
-    
-    # Update layout
-    fig.update_layout(
-        title={
-            'text': f"Temperature: {value:.1f}°C",
-            'y':0.85,
-            'x':0.5,
-            'xanchor': 'center',
-            'yanchor': 'top',
-            'font': dict(size=16, color=text_color)
-        },
-        height=100,
-        margin=dict(l=10, r=10, t=40, b=10),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(
-            showgrid=False,
-            zeroline=False,
-            showticklabels=False,
-            range=[-1, 101],
-            fixedrange=True
-        ),
-        yaxis=dict(
-            showgrid=False,
-            zeroline=False,
-            showticklabels=False,
-            range=[-0.5, 0.5],
-            fixedrange=True
-        ),
-        showlegend=False
-    )
-    
-    return fig
-
-def create_line_chart(df, y_col, title, height=300):
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=df[y_col],
-        mode='lines',
-        name=y_col,
-        line=dict(width=2)
-    ))
-    
-    fig.update_layout(
-        title=title,
-        height=height,
-        margin=dict(l=10, r=10, t=50, b=10),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='LightGray',
-            title="Time"
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='LightGray',
-            title=y_col
-        )
-    )
-    
-    return fig
-
 # Initialize placeholder containers
 if 'placeholder' not in st.session_state:
     with row1_col1:
@@ -329,11 +184,14 @@ if 'placeholder' not in st.session_state:
             st.session_state['metrics'] = st.empty()
     with failure_section:
         st.session_state['failure_warning'] = st.empty()
+        st.session_state['drift_warning'] = st.empty()
 
 def predict_failure(data):
     """Make failure prediction using the loaded model"""
-    if st.session_state.model is None:
+    # Skip predictions until the background load has finished
+    if not model_future.done() or model_future.result() is None:
         return None, None
+    model = model_future.result()
     
     # Prepare data for prediction
     features = ['temperature', 'vibration', 'pressure', 'motor_current']
@@ -341,14 +199,14 @@ def predict_failure(data):
     
     try:
         # Make prediction
-        prediction = st.session_state.model.predict(X)
-        probability = st.session_state.model.predict_proba(X)[0, 1]  # Probability of failure
+        prediction = model.predict(X)
+        probability = model.predict_proba(X)[0, 1]  # Probability of failure
         return prediction[0], probability
     except Exception as e:
         print(f"Error making prediction: {e}")
         return None, None
 
-def update_dashboard():
+def update_dashboard(force=False):
     try:
         # Process new data
         data_updated = False
@@ -364,9 +222,11 @@ def update_dashboard():
                 'failure': d['failure']
             }])
             st.session_state.data = pd.concat([st.session_state.data, new], ignore_index=True)
+            if st.session_state.drift_monitor is not None:
+                st.session_state.drift_monitor.update(d)
             data_updated = True
         
-        if not data_updated:
+        if not data_updated and not force:
             return
 
         # Implement sliding window using the latest timestamp from data
@@ -379,7 +239,13 @@ def update_dashboard():
 
         df = st.session_state.data
 
+        if data_updated and time.monotonic() - st.session_state.last_snapshot >= SNAPSHOT_INTERVAL:
+            save_snapshot(df)
+            st.session_state.last_snapshot = time.monotonic()
+
         if not df.empty:
+            from charts import create_line_chart, create_temperature_bar
+
             # Make failure prediction
             prediction, probability = predict_failure(df)
             
@@ -408,6 +274,23 @@ def update_dashboard():
                             unsafe_allow_html=True
                         )
             
+            # Warn when live readings no longer resemble the training data
+            drift = st.session_state.drift_monitor.status() if st.session_state.drift_monitor is not None else {}
+            drifted = [f for f, s in drift.items() if s['drift']]
+            if drifted:
+                with st.session_state['drift_warning']:
+                    st.markdown(
+                        f"""
+                        <div style="padding: 1rem; border-radius: 0.5rem; background-color: rgba(255, 165, 0, 0.15);">
+                            <h3 style="color: orange;">📉 Input Drift Detected</h3>
+                            <p>Live {', '.join(drifted)} readings differ from the training data; failure predictions may be unreliable.</p>
+                        </div>
+                        """,
+                        unsafe_allow_html=True
+                    )
+            else:
+                st.session_state['drift_warning'].empty()
+
             # Update temperature bar first for faster response
             current_temp = df['temperature'].iloc[-1]
             with st.session_state['temp_container']:
@@ -449,11 +332,23 @@ def update_dashboard():
                         st.metric("⚡ Total Energy", f"{energy_consumption:.1f} Wh")
                     with col2:
                         st.metric("⚠️ Failure Risk", f"{failure_probability:.1f}%")
+                    if drift:
+                        col3, col4 = st.columns(2)
+                        with col3:
+                            st.metric("📉 Max Drift (PSI)", f"{max(s['psi'] for s in drift.values()):.2f}")
+                        with col4:
+                            st.metric("📉 Max Drift (KS)", f"{max(s['ks'] for s in drift.values()):.2f}")
+
+            if not st.session_state.first_chart:
+                st.session_state.first_chart = True
+                print(f"Time to first chart: {time.perf_counter() - STARTUP_TIME:.2f}s")
     except Exception as e:
         print(f"Error in update_dashboard: {e}")
 
 # Main loop
 if __name__ == "__main__":
+    # Render the snapshot straight away instead of waiting for the first message
+    update_dashboard(force=True)
     while True:
             update_dashboard()
             time.sleep(0.1)  # Update 10 times per second for smoother animation 
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""Approximate the dashboard's import cost and time to first chart.
+
+This does not launch mqtt_visualizer.py under Streamlit. It replays the work
+the script does before its first chart in a fresh interpreter: the eager
+imports, the snapshot load and building the four Plotly figures. The model
+load (joblib + sklearn) runs inline in the "before" case. In the "after" case
+it runs in a background thread that competes for the GIL, as in the dashboard.
+Streamlit's own rendering and websocket time are not included; the dashboard
+logs its real "Time to first chart" on startup.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# The child interpreters import charts and dashboard_snapshot from the repo root
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Modules mqtt_visualizer.py imported at the top of the script before lazy loading
+EAGER_BEFORE = ['streamlit', 'pandas', 'plotly.graph_objects', 'paho.mqtt.client',
+                'streamlit_autorefresh', 'joblib']
+# Modules it still imports before the first chart can be drawn
+EAGER_AFTER = ['streamlit', 'pandas', 'drift_monitor', 'dashboard_snapshot']
+
+# Builds the first set of charts the way update_dashboard does, from the snapshot
+# when one exists and from a synthetic window otherwise.
+FIRST_CHART = """
+import time
+start = time.perf_counter()
+{imports}
+{model_before}
+import pandas as pd
+from dashboard_snapshot import load_snapshot
+df = load_snapshot()
+if df is None or df.empty:
+    df = pd.DataFrame({{
+        'timestamp': pd.date_range('2025-01-01', periods=60, freq='1min'),
+        'temperature': 75.0, 'vibration': 0.5, 'pressure': 100.0, 'power': 2200.0,
+    }})
+    df.loc[0, 'temperature'] = 70.0
+from charts import create_line_chart, create_temperature_bar
+figures = [
+    create_temperature_bar(df['temperature'].iloc[-1], df['temperature'].min(), df['temperature'].max()),
+    create_line_chart(df, 'vibration', 'Vibration'),
+    create_line_chart(df, 'pressure', 'Pressure'),
+    create_line_chart(df, 'power', 'Power Consumption'),
+]
+for fig in figures:
+    fig.to_json()
+print(time.perf_counter() - start)
+"""
+
+# What unpickling the forest costs: joblib plus the sklearn modules it references
+LOAD_MODEL = """
+import joblib
+import sklearn.ensemble
+try:
+    joblib.load('random_forest_model.joblib')
+except Exception:
+    pass
+"""
+
+BACKGROUND_MODEL = """
+import threading
+threading.Thread(target=exec, args=({code!r},), daemon=True).start()
+"""
+
+
+def run(code):
+    """Run code in a fresh interpreter and return the float it prints."""
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=ROOT)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def import_time(modules):
+    imports = '\n'.join(f"import {m}" for m in modules)
+    return run(f"import time\nstart = time.perf_counter()\n{imports}\nprint(time.perf_counter() - start)")
+
+
+def first_chart_time(modules, background_model):
+    imports = '\n'.join(f"import {m}" for m in modules)
+    model = BACKGROUND_MODEL.format(code=LOAD_MODEL) if background_model else LOAD_MODEL
+    return run(FIRST_CHART.format(imports=imports, model_before=model))
+
+
+def median_of(repeats, fn, *args):
+    return statistics.median(fn(*args) for _ in range(repeats))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dashboard import time and time-to-first-chart benchmark")
+    parser.add_argument('--repeats', type=int, default=5, help="Cold runs per measurement")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = {'per_module_import_seconds': {
+        m: median_of(args.repeats, import_time, [m]) for m in EAGER_BEFORE + EAGER_AFTER[2:]
+    }}
+    results['eager_import_seconds'] = {
+        'before': median_of(args.repeats, import_time, EAGER_BEFORE),
+        'after': median_of(args.repeats, import_time, EAGER_AFTER),
+    }
+    # Before: every import and the model load happen ahead of the first chart.
+    # After: the same model load runs concurrently in a background thread.
+    results['first_chart_seconds'] = {
+        'before': median_of(args.repeats, first_chart_time, EAGER_BEFORE, False),
+        'after': median_of(args.repeats, first_chart_time, EAGER_AFTER, True),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for module, seconds in results['per_module_import_seconds'].items():
+            print(f"import {module}: {seconds:.3f}s")
+        for name in ['eager_import_seconds', 'first_chart_seconds']:
+            before, after = results[name]['before'], results[name]['after']
+            print(f"{name}: before {before:.3f}s, after {after:.3f}s")
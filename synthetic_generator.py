@@ -0,0 +1,156 @@
+import argparse
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+VOLTAGE = 220
+
+# Per-feature (mean, std) of the healthy rows in Predictive_Maintenance_v2.csv
+FEATURE_STATS = {
+    'temperature': (75.0, 5.4),
+    'vibration': (0.5, 0.21),
+    'pressure': (100.0, 10.5),
+    'motor_current': (10.0, 2.1),
+}
+
+# Direction each feature moves in when a failure is injected
+FAILURE_SIGNATURE = {
+    'temperature': 1.0,
+    'vibration': 1.0,
+    'pressure': -1.0,
+    'motor_current': 1.0,
+}
+
+FAILURE_RATE = 0.05  # 250 of 5000 rows fail in the source CSV
+MACHINE_SPREAD = 0.25  # Per-machine baseline offset, in feature standard deviations
+SAMPLE_INTERVAL = 1  # Minutes between readings of the same machine
+START_TIME = '2025-01-01 00:00:00'
+BLOCK_ROWS = 10_000  # Rows drawn per random stream, independent of chunk_size so output depends only on the seed
+MAX_PENDING = 1000  # Published messages not yet handed to the socket before publishing blocks
+
+CSV_HEADERS = ['timestamp', 'machine_id', 'temperature', 'vibration', 'pressure',
+               'motor_current', 'power', 'failure']
+
+
+def generate_chunks(n_rows, n_machines=1, chunk_size=100_000, failure_rate=FAILURE_RATE,
+                    failure_shift=0.0, seed=42, start=START_TIME):
+    """Yield DataFrames of synthetic telemetry totalling n_rows rows.
+
+    Rows are interleaved across machines, one reading per machine per minute.
+    Failures are drawn independently per row at failure_rate; failure_shift moves
+    the failing rows' features by that many standard deviations along
+    FAILURE_SIGNATURE (0 reproduces the source CSV, where failures are not
+    separable from healthy readings). For a given seed the rows do not depend
+    on chunk_size, which only bounds memory.
+    """
+    start = pd.Timestamp(start)
+    names = list(FEATURE_STATS)
+    means = np.array([FEATURE_STATS[name][0] for name in names])
+    stds = np.array([FEATURE_STATS[name][1] for name in names])
+    signature = np.array([FAILURE_SIGNATURE[name] for name in names])
+    machine_offsets = np.random.default_rng(seed).normal(0.0, MACHINE_SPREAD, size=(n_machines, len(names))) * stds
+
+    def draw(number):
+        # Each block of BLOCK_ROWS rows has its own stream, so chunk_size only
+        # changes how rows are grouped, never their values
+        rng = np.random.default_rng([seed, number])
+        return rng.random(BLOCK_ROWS) < failure_rate, rng.normal(means, stds, size=(BLOCK_ROWS, len(names)))
+
+    block_number, block = None, None
+    for offset in range(0, n_rows, chunk_size):
+        size = min(chunk_size, n_rows - offset)
+        index = np.arange(offset, offset + size)
+        machine_id = index % n_machines
+
+        failure = np.empty(size, dtype=bool)
+        values = np.empty((size, len(names)))
+        row = offset
+        while row < offset + size:
+            if block_number != row // BLOCK_ROWS:
+                block_number = row // BLOCK_ROWS
+                block = draw(block_number)
+            first = row - block_number * BLOCK_ROWS
+            take = min(BLOCK_ROWS - first, offset + size - row)
+            failure[row - offset:row - offset + take] = block[0][first:first + take]
+            values[row - offset:row - offset + take] = block[1][first:first + take]
+            row += take
+
+        values += machine_offsets[machine_id]
+        if failure_shift:
+            values[failure] += failure_shift * signature * stds
+
+        chunk = pd.DataFrame(values, columns=names)
+        chunk.insert(0, 'machine_id', machine_id)
+        chunk.insert(0, 'timestamp', start + pd.to_timedelta(index // n_machines * SAMPLE_INTERVAL, unit='min'))
+        chunk['power'] = chunk['motor_current'] * VOLTAGE
+        chunk['failure'] = failure.astype(float)
+        yield chunk[CSV_HEADERS]
+
+
+def write_csv(chunks, path):
+    """Append each chunk to path, writing the header only once."""
+    rows = 0
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+        rows += len(chunk)
+        print(f"Wrote {rows} rows to {path}")
+    return rows
+
+
+def publish_mqtt(chunks, rate=0.0):
+    """Publish each row in the mqtt_publisher message format.
+
+    rate is messages per second; 0 publishes as fast as the broker accepts them.
+    paho queues outgoing messages without limit, so at most MAX_PENDING are
+    left unsent before waiting on the oldest.
+    """
+    from mqtt_client import MQTT_TOPIC, connect_client
+
+    client = connect_client()
+    delay = 1.0 / rate if rate > 0 else 0.0
+    pending = deque()
+    rows = 0
+    try:
+        for chunk in chunks:
+            # Serialise the whole chunk at once rather than one row at a time
+            messages = chunk.to_json(orient='records', lines=True, date_format='iso').splitlines()
+            for message in messages:
+                pending.append(client.publish(MQTT_TOPIC, message))
+                if len(pending) >= MAX_PENDING:
+                    pending.popleft().wait_for_publish()
+                if delay:
+                    time.sleep(delay)
+            rows += len(messages)
+            print(f"Published {rows} rows to {MQTT_TOPIC}")
+        while pending:
+            pending.popleft().wait_for_publish()
+    finally:
+        client.loop_stop()
+        client.disconnect()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Synthetic machine telemetry generator")
+    parser.add_argument('rows', type=int, help="Total number of rows to generate")
+    parser.add_argument('--machines', type=int, default=1, help="Number of machines")
+    parser.add_argument('--chunk-size', type=int, default=100_000, help="Rows held in memory at once")
+    parser.add_argument('--failure-rate', type=float, default=FAILURE_RATE, help="Probability a row is a failure")
+    parser.add_argument('--failure-shift', type=float, default=0.0,
+                        help="Shift of failing rows in standard deviations (0 matches the source CSV)")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    parser.add_argument('--start', type=str, default=START_TIME, help="Timestamp of the first reading")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--output', type=str, help="CSV file to write")
+    target.add_argument('--mqtt', action='store_true', help="Publish rows to the MQTT broker")
+    parser.add_argument('--rate', type=float, default=0.0, help="MQTT messages per second (0 = unthrottled)")
+    args = parser.parse_args()
+
+    chunks = generate_chunks(args.rows, args.machines, args.chunk_size, args.failure_rate,
+                             args.failure_shift, args.seed, args.start)
+    if args.output:
+        write_csv(chunks, args.output)
+    else:
+        publish_mqtt(chunks, args.rate)
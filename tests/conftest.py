@@ -0,0 +1,8 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The tools are plain scripts, so make the repo root and dataviz/ importable
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'dataviz'))
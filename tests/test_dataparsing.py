@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+import dataparsing
+from dataparsing import expanded_files, load_expanded, parse_incremental
+
+
+def line(index, fields):
+    raw = json.dumps(fields).replace('"', '""')
+    return f'{index},2025-03-25 10:00:{index:02d},"{raw}"\n'
+
+
+@pytest.fixture
+def output(tmp_path):
+    return str(tmp_path / 'expanded')
+
+
+def test_parses_only_appended_lines(tmp_path, output):
+    source = tmp_path / 'haas.csv'
+    source.write_text(line(0, {'Spindle RPM': 100}) + line(1, {'Spindle RPM': 200}))
+    assert parse_incremental([source], output) == 2
+
+    with open(source, 'a') as f:
+        f.write(line(2, {'Spindle RPM': 300}) + '3,2025-03-25 10:00:03,"{""Spin')
+    assert parse_incremental([source], output) == 1
+    assert parse_incremental([source], output) == 0
+    assert list(load_expanded(output)['Spindle RPM']) == [100, 200, 300]
+
+
+def test_growing_small_source_is_not_treated_as_replaced(tmp_path, output, capsys):
+    source = tmp_path / 'haas.csv'
+    source.write_text(line(0, {'a': 1}))
+    parse_incremental([source], output)
+    for i in range(1, 4):
+        with open(source, 'a') as f:
+            f.write(line(i, {'a': i}))
+        assert parse_incremental([source], output) == 1
+    assert 'replaced' not in capsys.readouterr().out
+    assert len(load_expanded(output)) == 4
+
+
+def test_new_fields_start_a_new_part(tmp_path, output):
+    source = tmp_path / 'haas.csv'
+    source.write_text(line(0, {'a': 1}))
+    parse_incremental([source], output)
+    first_part = expanded_files(output)[0]
+    before = open(first_part).read()
+
+    with open(source, 'a') as f:
+        f.write(line(1, {'a': 2, 'b': 3}) + line(2, {'a': 4}))
+    parse_incremental([source], output)
+
+    files = expanded_files(output)
+    assert len(files) == 2 and open(first_part).read() == before
+    df = load_expanded(output)
+    assert list(df['a']) == [1, 2, 4]
+    assert df['b'].isna().tolist() == [True, False, True]
+
+
+def test_replaced_source_keeps_other_sources(tmp_path, output):
+    first, second = tmp_path / 'first.csv', tmp_path / 'second.csv'
+    first.write_text(line(0, {'a': 1}) + line(1, {'a': 2}))
+    second.write_text(line(0, {'a': 10}))
+    parse_incremental([first, second], output)
+
+    first.write_text(line(0, {'a': 5}))
+    assert parse_incremental([first], output) == 1
+    assert sorted(load_expanded(output)['a']) == [5, 10]
+
+
+def test_interrupted_run_does_not_duplicate_rows(tmp_path, output, monkeypatch):
+    source = tmp_path / 'haas.csv'
+    source.write_text(line(0, {'a': 1}))
+    parse_incremental([source], output)
+
+    with open(source, 'a') as f:
+        f.write(line(1, {'a': 2}))
+
+    def crash(output, checkpoint):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(dataparsing, 'save_checkpoint', crash)
+    with pytest.raises(KeyboardInterrupt):
+        parse_incremental([source], output)
+    monkeypatch.undo()
+
+    parse_incremental([source], output)
+    assert list(load_expanded(output)['a']) == [1, 2]
+
+
+def test_final_parses_last_line_without_newline(tmp_path, output):
+    source = tmp_path / 'haas.csv'
+    source.write_text(line(0, {'a': 1}) + line(1, {'a': 2}).rstrip('\n'))
+    assert parse_incremental([source], output) == 1
+    assert parse_incremental([source], output, final=True) == 1
+    assert list(load_expanded(output)['a']) == [1, 2]
+
+    assert parse_incremental([source], output, full=True) == 2
+    assert list(load_expanded(output)['a']) == [1, 2]
+
+
+def test_load_expanded_filters_by_source(tmp_path, output):
+    first, second = tmp_path / 'first.csv', tmp_path / 'second.csv'
+    first.write_text(line(0, {'a': 1}) + line(1, {'a': 2}))
+    second.write_text(line(0, {'b': 10}))
+    parse_incremental([first, second], output)
+
+    df = load_expanded(output, sources=[first])
+    assert list(df['a']) == [1, 2] and 'b' not in df
+    assert list(load_expanded(output, sources=[second])['b']) == [10]
+    with pytest.raises(ValueError):
+        load_expanded(output, sources=[tmp_path / 'unparsed.csv'])
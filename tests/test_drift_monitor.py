@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from drift_monitor import MIN_SAMPLES, WINDOW_SIZE, DriftMonitor, build_baseline
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FEATURES = ['temperature', 'vibration', 'pressure', 'motor_current']
+
+
+def load_data():
+    return pd.read_csv(os.path.join(ROOT, 'Predictive_Maintenance_v2.csv'))
+
+
+def test_no_drift_on_in_distribution_samples():
+    df = load_data()
+    baseline = build_baseline(df[FEATURES].sample(4000, random_state=1).to_numpy(), FEATURES)
+    records = df[FEATURES].to_dict('records')
+    rng = np.random.default_rng(0)
+    for n in [MIN_SAMPLES, WINDOW_SIZE]:
+        for _ in range(50):
+            monitor = DriftMonitor(baseline)
+            for i in rng.integers(0, len(records), n):
+                monitor.update(records[i])
+            assert monitor.drifted_features() == []
+
+
+def test_no_drift_while_replaying_training_csv():
+    df = load_data()
+    baseline = build_baseline(df[FEATURES].to_numpy(), FEATURES)
+    monitor = DriftMonitor(baseline)
+    for reading in df[FEATURES].to_dict('records'):
+        monitor.update(reading)
+        assert monitor.drifted_features() == []
+
+
+def test_detects_shifted_feature():
+    df = load_data()
+    baseline = build_baseline(df[FEATURES].to_numpy(), FEATURES)
+    monitor = DriftMonitor(baseline)
+    shifted = df[FEATURES].sample(WINDOW_SIZE, random_state=2).copy()
+    shifted['temperature'] += df['temperature'].std()
+    for reading in shifted.to_dict('records'):
+        monitor.update(reading)
+    assert monitor.drifted_features() == ['temperature']
+
+
+def test_window_evicts_old_samples():
+    baseline = build_baseline(np.arange(100.0).reshape(-1, 1), ['x'])
+    monitor = DriftMonitor(baseline, window_size=10)
+    for value in range(25):
+        monitor.update({'x': float(value)})
+    assert monitor.status()['x']['samples'] == 10
+    monitor.update({'x': float('nan')})
+    assert monitor.status()['x']['samples'] == 9
@@ -0,0 +1,120 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from profile_report import DatasetProfile, FrequentValues, Reservoir, profile_files
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def profile_of(*chunks, seed=0):
+    profile = DatasetProfile(sample_size=100, seed=seed)
+    for chunk in chunks:
+        profile.add(chunk)
+    return profile
+
+
+def assert_same_profile(a, b):
+    assert a.rows == b.rows
+    assert set(a.columns) == set(b.columns)
+    for name, column in a.columns.items():
+        other = b.columns[name]
+        assert (column.count, column.text_count) == (other.count, other.text_count)
+        if column.count:
+            assert column.mean == pytest.approx(other.mean)
+            assert column.m2 == pytest.approx(other.m2)
+            assert (column.min, column.max) == (other.min, other.max)
+    pd.testing.assert_frame_equal(a.correlations(), b.correlations().loc[a.numeric, a.numeric])
+
+
+def test_reservoir_merge_is_uniform():
+    rng = np.random.default_rng(0)
+    from_first = 0
+    for _ in range(2000):
+        first, second = Reservoir(100, rng), Reservoir(100, rng)
+        first.add(np.zeros(1000))
+        second.add(np.ones(3000))
+        first.merge(second)
+        assert len(first.values) == 100 and first.seen == 4000
+        from_first += (first.values == 0).sum()
+    assert from_first / (2000 * 100) == pytest.approx(0.25, abs=0.01)
+
+
+def test_reservoir_keeps_everything_below_capacity():
+    reservoir = Reservoir(10, np.random.default_rng(0))
+    reservoir.add(np.arange(4.0))
+    reservoir.add(np.arange(4.0, 8.0))
+    assert sorted(reservoir.values) == list(range(8))
+
+
+def test_frequent_values_keep_heavy_hitters():
+    rng = np.random.default_rng(0)
+    stream = np.concatenate([np.full(3000, 'a'), np.full(2000, 'b'), rng.integers(0, 5000, 5000).astype(str)])
+    rng.shuffle(stream)
+    merged = FrequentValues(5)
+    for part in np.array_split(stream, 7):
+        summary = FrequentValues(5)
+        summary.add(pd.Series(part).value_counts().to_dict())
+        merged.merge(summary)
+    top = dict(merged.top())
+    assert len(top) <= 5
+    # Misra-Gries undercounts by at most n / (k + 1) per value
+    assert 3000 - len(stream) / 6 <= top['a'] <= 3000
+    assert 2000 - len(stream) / 6 <= top['b'] <= 2000
+
+
+def test_merge_matches_single_pass():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(size=(1000, 3)), columns=['x', 'y', 'z'])
+    df.loc[rng.choice(1000, 100, replace=False), 'y'] = np.nan
+    whole = profile_of(df)
+    merged = profile_of(df.iloc[:300]).merge(profile_of(df.iloc[300:]))
+    assert_same_profile(whole, merged)
+    expected = df.corr()
+    np.testing.assert_allclose(whole.correlations().loc[expected.index, expected.columns], expected)
+
+
+def test_merge_with_reordered_and_extra_columns():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame(rng.normal(size=(500, 3)), columns=['x', 'y', 'z'])
+    extra = df.iloc[250:][['z', 'x', 'y']].assign(w=rng.normal(size=250))
+    merged = profile_of(df.iloc[:250]).merge(profile_of(extra))
+    chunked = profile_of(df.iloc[:250], extra)
+    assert_same_profile(merged, chunked)
+    assert merged.rows == 500
+    assert merged.columns['w'].summary(merged.rows)['missing'] == 250
+    assert merged.correlations().loc['x', 'w'] == pytest.approx(extra['x'].corr(extra['w']))
+
+
+def test_column_turning_non_numeric_is_not_missing():
+    first = pd.DataFrame({'x': [1.0, 2.0, 3.0]})
+    second = pd.DataFrame({'x': ['a', 'b', 'c', 'd', 'e'], 'late': [1, 2, 3, 4, 5]})
+    profile = profile_of(first, second)
+    summary = profile.columns['x'].summary(profile.rows)
+    assert profile.columns['x'].kind == 'mixed'
+    assert summary['missing'] == 0 and summary['numeric'] == 3 and summary['text'] == 5
+    assert profile.columns['late'].summary(profile.rows)['missing'] == 3
+
+
+def test_correlations_keep_precision_with_large_offsets():
+    rng = np.random.default_rng(3)
+    x = 1e8 + rng.normal(size=20_000)
+    y = 1e9 + x - 1e8 + 0.1 * rng.normal(size=20_000)
+    df = pd.DataFrame({'x': x, 'y': y})
+    profile = profile_of(*[df.iloc[i:i + 3000] for i in range(0, len(df), 3000)])
+    corr = profile.correlations()
+    expected = np.corrcoef(x - 1e8, y - 1e9)[0, 1]
+    assert corr.loc['x', 'x'] == pytest.approx(1.0)
+    assert corr.loc['y', 'y'] == pytest.approx(1.0)
+    assert corr.loc['x', 'y'] == pytest.approx(expected, abs=1e-6)
+
+
+def test_profile_repo_csvs_in_parallel():
+    paths = [os.path.join(ROOT, 'Predictive_Maintenance_v2.csv'),
+             os.path.join(ROOT, 'Predictive_Maintenance_Dataset.csv')]
+    profile = profile_files(paths, chunk_size=1000, sample_size=100, workers=2)
+    assert profile.rows == 10_000
+    assert profile.columns['power'].summary(profile.rows)['missing'] == 5000
+    assert profile.columns['temperature'].count == 10_000
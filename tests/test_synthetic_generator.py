@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from synthetic_generator import BLOCK_ROWS, CSV_HEADERS, VOLTAGE, generate_chunks
+
+
+def generate(*args, **kwargs):
+    return pd.concat(generate_chunks(*args, **kwargs), ignore_index=True)
+
+
+def test_chunks_total_requested_rows():
+    chunks = list(generate_chunks(25, 3, chunk_size=7))
+    assert [len(chunk) for chunk in chunks] == [7, 7, 7, 4]
+    assert list(chunks[0].columns) == CSV_HEADERS
+
+
+def test_readings_are_one_interval_apart_per_machine():
+    df = generate(60, 4, chunk_size=13)
+    for _, machine in df.groupby('machine_id'):
+        assert (machine['timestamp'].diff().dropna() == pd.Timedelta(minutes=1)).all()
+    assert sorted(df['machine_id'].unique()) == [0, 1, 2, 3]
+
+
+def test_failure_rate_within_tolerance():
+    df = generate(50_000, 5, failure_rate=0.05)
+    # Binomial standard error at this size is ~0.001
+    assert abs(df['failure'].mean() - 0.05) < 0.005
+
+
+def test_power_is_motor_current_times_voltage():
+    df = generate(1000, 2)
+    np.testing.assert_allclose(df['power'], df['motor_current'] * VOLTAGE)
+
+
+def test_same_seed_gives_same_output():
+    pdt.assert_frame_equal(generate(500, 3, seed=7), generate(500, 3, seed=7))
+    assert not generate(500, 3, seed=7).equals(generate(500, 3, seed=8))
+
+
+def test_output_does_not_depend_on_chunk_size():
+    rows = BLOCK_ROWS + 25
+    expected = generate(rows, 3, chunk_size=rows, failure_shift=1.5)
+    for chunk_size in [7, 25, BLOCK_ROWS - 1, BLOCK_ROWS]:
+        pdt.assert_frame_equal(generate(rows, 3, chunk_size=chunk_size, failure_shift=1.5), expected)
@@ -0,0 +1,67 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+
+import train_model
+from train_model import FEATURES, build_models, check_selection, fit_and_score, load_features, train
+
+
+@pytest.fixture
+def dataset(tmp_path, monkeypatch):
+    monkeypatch.setattr(train_model, 'CACHE_DIR', str(tmp_path / 'cache'))
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(300, len(FEATURES))), columns=FEATURES)
+    df['failure'] = (df['temperature'] + rng.normal(scale=0.5, size=300) > 1).astype(float)
+    path = tmp_path / 'train.csv'
+    df.to_csv(path, index=False)
+    return [str(path)]
+
+
+def test_feature_cache_miss_then_hit(dataset):
+    *first, hit = load_features(dataset)
+    assert not hit
+    *second, hit = load_features(dataset)
+    assert hit
+    pd.testing.assert_frame_equal(first[0], second[0])
+    assert list(first[0].columns) == FEATURES
+
+
+def test_fit_and_score_matches_predict(dataset):
+    X_train, X_val, y_train, y_val, _ = load_features(dataset)
+    _, model, entry = fit_and_score('logistic_regression', build_models()['logistic_regression'],
+                                    X_train, X_val, y_train, y_val)
+    y_pred = model.predict(X_val)
+    metrics = entry['metrics']
+    assert metrics['accuracy'] == accuracy_score(y_val, y_pred)
+    assert metrics['precision'] == precision_score(y_val, y_pred, zero_division=0)
+    assert metrics['recall'] == recall_score(y_val, y_pred, zero_division=0)
+    assert metrics['f1'] == f1_score(y_val, y_pred, zero_division=0)
+
+
+def test_check_selection_rejects_unknown_models():
+    with pytest.raises(ValueError):
+        check_selection(['random_forest', 'xgboost'], 'random_forest')
+    with pytest.raises(ValueError):
+        check_selection(['decision_tree'], 'random_forest')
+    check_selection(['decision_tree'], 'best')
+
+
+def test_train_writes_model_report_and_baseline(dataset, tmp_path):
+    output_dir = str(tmp_path / 'models')
+    model_path = train(dataset, ['logistic_regression', 'decision_tree'], 'best', n_jobs=1, output_dir=output_dir)
+
+    assert os.path.exists(model_path)
+    with open(os.path.join(output_dir, 'training_report.json')) as f:
+        report = json.load(f)
+    assert set(report['models']) == {'logistic_regression', 'decision_tree'}
+    assert report['model_path'] == model_path
+    with open(os.path.join(output_dir, 'drift_baseline.json')) as f:
+        assert set(json.load(f)) == set(FEATURES)
+
+    with pytest.raises(FileExistsError):
+        train(dataset, ['decision_tree'], 'decision_tree', n_jobs=1, output_dir=output_dir)
+    train(dataset, ['decision_tree'], 'decision_tree', n_jobs=1, output_dir=output_dir, force=True)
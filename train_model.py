@@ -0,0 +1,226 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import (accuracy_score, average_precision_score, confusion_matrix,
+                             f1_score, precision_score, recall_score, roc_auc_score)
+from sklearn.model_selection import train_test_split
+from sklearn.neural_network import MLPClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+from drift_monitor import build_baseline, save_baseline
+
+RANDOM_STATE = 42
+TEST_SIZE = 0.2
+FEATURES = ['temperature', 'vibration', 'pressure', 'motor_current']
+TARGET = 'failure'
+CACHE_DIR = os.getenv('TRAINING_CACHE_DIR', '.cache/features')
+CACHE_VERSION = 2  # Bump when the cached split's format changes
+OUTPUT_DIR = 'models'  # Kept apart from ./random_forest_model.joblib, which the dashboard loads
+DEFAULT_MODELS = ['logistic_regression', 'decision_tree', 'random_forest',
+                  'neural_network', 'gradient_boosting']
+
+
+def build_models():
+    """Candidate models, configured as in failure_prediction.ipynb."""
+    return {
+        'logistic_regression': Pipeline([
+            ('scaler', StandardScaler()),
+            ('lr', LogisticRegression(random_state=RANDOM_STATE))
+        ]),
+        'decision_tree': DecisionTreeClassifier(random_state=RANDOM_STATE),
+        'random_forest': RandomForestClassifier(random_state=RANDOM_STATE),
+        'neural_network': Pipeline([
+            ('scaler', StandardScaler()),
+            ('mlp', MLPClassifier(random_state=RANDOM_STATE, max_iter=300))
+        ]),
+        'gradient_boosting': GradientBoostingClassifier(
+            n_estimators=100,
+            learning_rate=0.1,
+            max_depth=3,
+            random_state=RANDOM_STATE
+        ),
+        'svm': Pipeline([
+            ('scaler', StandardScaler()),
+            ('svm', SVC(kernel='rbf', probability=True, random_state=RANDOM_STATE))
+        ]),
+    }
+
+
+def dataset_hash(paths):
+    """Hash the dataset contents together with the preprocessing settings."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([CACHE_VERSION, FEATURES, TARGET, TEST_SIZE, RANDOM_STATE]).encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def load_features(paths):
+    """Return the train/validation split, reusing the on-disk cache when the data is unchanged.
+
+    Returns (X_train, X_val, y_train, y_val, cache_hit).
+    """
+    cache_path = os.path.join(CACHE_DIR, f"{dataset_hash(paths)}.joblib")
+    if os.path.exists(cache_path):
+        return (*joblib.load(cache_path), True)
+
+    df = pd.concat([pd.read_csv(path, usecols=FEATURES + [TARGET]) for path in paths], ignore_index=True)
+    df = df.dropna()
+    # Keep DataFrames so models record feature names, matching the notebook and the dashboard's predict calls
+    X = df[FEATURES].astype(np.float64)
+    y = df[TARGET]
+    split = train_test_split(X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=y)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    joblib.dump(tuple(split), cache_path)
+    return (*split, False)
+
+
+def fit_and_score(name, model, X_train, X_val, y_train, y_val):
+    """Fit one model and compute all of its metrics from a single predict_proba pass."""
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    proba = model.predict_proba(X_val)
+    score_seconds = time.perf_counter() - start
+
+    # Same decision rule as predict(), without a second pass over X_val
+    y_pred = model.classes_[proba.argmax(axis=1)]
+    y_scores = proba[:, 1]
+    tn, fp, fn, tp = confusion_matrix(y_val, y_pred, labels=model.classes_).ravel()
+
+    metrics = {
+        'accuracy': accuracy_score(y_val, y_pred),
+        'precision': precision_score(y_val, y_pred, zero_division=0),
+        'recall': recall_score(y_val, y_pred, zero_division=0),
+        'f1': f1_score(y_val, y_pred, zero_division=0),
+        'roc_auc': roc_auc_score(y_val, y_scores),
+        'avg_precision': average_precision_score(y_val, y_scores),
+        'true_negatives': int(tn),
+        'false_positives': int(fp),
+        'false_negatives': int(fn),
+        'true_positives': int(tp),
+    }
+    return name, model, {'fit_seconds': fit_seconds, 'score_seconds': score_seconds, 'metrics': metrics}
+
+
+def check_selection(model_names, select):
+    """Raise ValueError before any training if the model choices are inconsistent."""
+    unknown = [name for name in model_names if name not in build_models()]
+    if unknown:
+        raise ValueError(f"Unknown models {unknown}; choose from {list(build_models())}")
+    if select != 'best' and select not in model_names:
+        raise ValueError(f"select must be 'best' or one of {list(model_names)}")
+
+
+def check_outputs(model_names, select, output_dir, baseline_path, force):
+    """Raise FileExistsError before any training if a model or baseline would be overwritten without force."""
+    saved = model_names if select == 'best' else [select]
+    paths = [os.path.join(output_dir, f"{name}_model.joblib") for name in saved] + [baseline_path]
+    existing = [path for path in paths if os.path.exists(path)]
+    if existing and not force:
+        raise FileExistsError(f"{existing} already exist; use --force to overwrite")
+
+
+def train(paths, model_names=DEFAULT_MODELS, select='random_forest', n_jobs=-1,
+          output_dir=OUTPUT_DIR, report_path=None, baseline_path=None, force=False):
+    """Train the candidate models in parallel, save the selected one and write a timing report.
+
+    select is a model name, or 'best' for the highest average precision. The
+    training feature distributions are snapshotted to baseline_path for
+    drift_monitor. The report and baseline default to output_dir, and an
+    existing model or baseline is only replaced with force. Returns the path
+    of the saved model.
+    """
+    check_selection(model_names, select)
+    report_path = report_path or os.path.join(output_dir, 'training_report.json')
+    baseline_path = baseline_path or os.path.join(output_dir, 'drift_baseline.json')
+    check_outputs(model_names, select, output_dir, baseline_path, force)
+    os.makedirs(output_dir, exist_ok=True)
+    candidates = build_models()
+
+    start = time.perf_counter()
+    X_train, X_val, y_train, y_val, cache_hit = load_features(paths)
+    load_seconds = time.perf_counter() - start
+    print(f"Loaded {len(X_train) + len(X_val)} rows in {load_seconds:.2f}s (cache {'hit' if cache_hit else 'miss'})")
+
+    save_baseline(build_baseline(X_train, FEATURES), baseline_path)
+    print(f"Saved drift baseline to {baseline_path}")
+
+    start = time.perf_counter()
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(fit_and_score)(name, candidates[name], X_train, X_val, y_train, y_val)
+        for name in model_names
+    )
+    train_seconds = time.perf_counter() - start
+
+    models = {name: model for name, model, _ in results}
+    report = {name: entry for name, _, entry in results}
+    for name, entry in report.items():
+        m = entry['metrics']
+        print(f"{name} - fit {entry['fit_seconds']:.2f}s, Accuracy: {m['accuracy']:.4f}, "
+              f"Avg Precision: {m['avg_precision']:.4f}, ROC AUC: {m['roc_auc']:.4f}")
+
+    if select == 'best':
+        select = max(report, key=lambda name: report[name]['metrics']['avg_precision'])
+    model_path = os.path.join(output_dir, f"{select}_model.joblib")
+    joblib.dump(models[select], model_path)
+    print(f"Saved {select} to {model_path}")
+
+    with open(report_path, 'w') as f:
+        json.dump({
+            'datasets': list(paths),
+            'features': FEATURES,
+            'cache_hit': cache_hit,
+            'load_seconds': load_seconds,
+            'train_seconds': train_seconds,
+            'selected': select,
+            'model_path': model_path,
+            'baseline_path': baseline_path,
+            'models': report,
+        }, f, indent=2)
+    print(f"Wrote timing report to {report_path}")
+    return model_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train failure prediction models")
+    parser.add_argument('datasets', nargs='+',
+                        help="Training CSV files, e.g. the notebook's Predictive_Maintenance_Dataset_train_aug.csv")
+    parser.add_argument('--models', nargs='+', default=DEFAULT_MODELS,
+                        choices=list(build_models()), help="Candidate models to train")
+    parser.add_argument('--select', default='random_forest',
+                        help="Model to save, or 'best' for the highest average precision")
+    parser.add_argument('--n-jobs', type=int, default=-1, help="Parallel workers (-1 = all cores)")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR,
+                        help="Directory for the saved model, report and baseline ('.' is what the dashboard loads)")
+    parser.add_argument('--report', help="Timing report path (default: in --output-dir)")
+    parser.add_argument('--baseline', help="Drift baseline snapshot path (default: in --output-dir)")
+    parser.add_argument('--force', action='store_true', help="Overwrite an existing model and baseline")
+    args = parser.parse_args()
+
+    baseline = args.baseline or os.path.join(args.output_dir, 'drift_baseline.json')
+    try:
+        check_selection(args.models, args.select)
+        check_outputs(args.models, args.select, args.output_dir, baseline, args.force)
+    except (ValueError, FileExistsError) as e:
+        parser.error(str(e))
+
+    train(args.datasets, args.models, args.select, args.n_jobs, args.output_dir,
+          args.report, baseline, args.force)